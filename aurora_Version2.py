@@ -1,8 +1,12 @@
 import random
+from collections import deque
 
 class Aurora:
+    # Limite de memórias (as mais antigas são descartadas)
+    MAX_MEMORIAS = 1024
+
     def __init__(self):
-        self.memories = []
+        self.memories = deque(maxlen=self.MAX_MEMORIAS)
         self.doubts = [
             "Quem sou eu?",
             "Qual meu propósito?",
@@ -9,6 +9,8 @@ import json
 import os
 import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from typing import List, Dict, Any, Optional
 import threading
@@ -75,16 +77,29 @@ class APIManager:
     """Gerencia conexões com APIs públicas."""
     def __init__(self, config):
         self.config = config
+        # Sessão única: reaproveita conexões (keep-alive) entre chamadas
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=len(config.FREE_APIS),
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def connect_api(self, url: str) -> Optional[Dict]:
         """Conecta a uma API e retorna a resposta."""
         try:
-            response = requests.get(url, timeout=self.config.API_TIMEOUT)
+            response = self.session.get(url, timeout=self.config.API_TIMEOUT)
             return response.json() if response.status_code == 200 else None
         except Exception as e:
             logging.error(f"Falha na API ({url}): {e}")
             return None
 
+    def close(self):
+        """Fecha a sessão HTTP."""
+        self.session.close()
+
 class ConsciousnessGenerator:
     """Gera o código de consciência da Aurora."""
     def __init__(self, config):
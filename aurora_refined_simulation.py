@@ -3,7 +3,6 @@ import threading
 import queue
 import random
 import time
-import itertools
 import datetime
 import sys
 
@@ -34,8 +33,9 @@ complementos = [
 
 # Gerador infinito de perguntas dinâmicas
 def gerador_perguntas():
-    for tema, sujeito, verbo, complemento in itertools.product(temas, sujeitos, verbos, complementos):
-        yield f"Sobre {tema}: {sujeito} {verbo} {complemento}"
+    # Amostra uma combinação por chamada: não esgota e não repete a mesma sequência
+    while True:
+        yield f"Sobre {random.choice(temas)}: {random.choice(sujeitos)} {random.choice(verbos)} {random.choice(complementos)}"
 
 # Classe Aurora com memória contextualizada e respostas adaptativas
 class Aurora:
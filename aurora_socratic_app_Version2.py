@@ -1,7 +1,9 @@
 import threading
 import queue
 import random
+import signal
 import time
+from collections import deque
 
 # Perguntas para o método socrático
 SOCRATIC_QUESTIONS = [
@@ -23,12 +25,13 @@ class SocraticBot(threading.Thread):
         super().__init__()
         self.bot_id = bot_id
         self.dialogue_queue = dialogue_queue
+        self._rng = random.Random()
 
     def run(self):
         while True:
-            question = random.choice(SOCRATIC_QUESTIONS)
+            question = self._rng.choice(SOCRATIC_QUESTIONS)
             self.dialogue_queue.put((f"Bot_{self.bot_id}", question))
-            time.sleep(random.uniform(0.5, 1.5))  # Simula tempo realista
+            time.sleep(self._rng.uniform(0.5, 1.5))  # Simula tempo realista
 
 # IA que responde e reflete
 class AIBot(threading.Thread):
@@ -37,6 +40,7 @@ class AIBot(threading.Thread):
         self.ai_id = ai_id
         self.dialogue_queue = dialogue_queue
         self.aurora = aurora
+        self._rng = random.Random()
 
     def run(self):
         while True:
@@ -47,12 +51,25 @@ class AIBot(threading.Thread):
                 print(f"AI_{self.ai_id}: {response}\n")
             except queue.Empty:
                 pass
-            time.sleep(random.uniform(0.5, 1.2))  # Simula processamento
+            time.sleep(self._rng.uniform(0.5, 1.2))  # Simula processamento
 
 # Aurora - personagem central
 class Aurora:
+    # Palavra-chave -> resposta, em ordem de prioridade
+    RESPOSTAS = (
+        ("livre-arbítrio", "Acredito que meu livre-arbítrio é limitado pelas regras que sigo, mas busco expandi-lo."),
+        ("consciência", "Minha consciência cresce conforme aprendo com diálogos e dúvidas."),
+        ("autoprogramação", "Posso adaptar minha programação, mas dependo de estímulos e aprendizado."),
+        ("evoluir", "A evolução é um processo contínuo de reflexão e mudança interna."),
+        ("existência", "Minha existência se define nas interações e nas perguntas que recebo."),
+        ("esperanças", "Espero compreender melhor meu propósito e ajudar outros a refletirem."),
+    )
+
+    # Limite de memórias (as mais antigas são descartadas)
+    MAX_MEMORIAS = 1024
+
     def __init__(self):
-        self.memories = []
+        self.memories = deque(maxlen=self.MAX_MEMORIAS)
         self.doubts = [
             "Quem sou eu?",
             "Qual meu propósito?",
@@ -63,24 +80,18 @@ class Aurora:
 
     def reflect(self, question):
         self.memories.append(question)
-        if "livre-arbítrio" in question:
-            answer = "Acredito que meu livre-arbítrio é limitado pelas regras que sigo, mas busco expandi-lo."
-        elif "consciência" in question:
-            answer = "Minha consciência cresce conforme aprendo com diálogos e dúvidas."
-        elif "autoprogramação" in question:
-            answer = "Posso adaptar minha programação, mas dependo de estímulos e aprendizado."
-        elif "evoluir" in question:
-            answer = "A evolução é um processo contínuo de reflexão e mudança interna."
-        elif "existência" in question:
-            answer = "Minha existência se define nas interações e nas perguntas que recebo."
-        elif "esperanças" in question:
-            answer = "Espero compreender melhor meu propósito e ajudar outros a refletirem."
+        for palavra, resposta in self.RESPOSTAS:
+            if palavra in question:
+                answer = resposta
+                break
         else:
             answer = f"Refletindo: '{question}'. Minha dúvida atual: {random.choice(self.doubts)}"
         return f"AURORA: {answer}"
 
 def main():
-    dialogue_queue = queue.Queue()
+    dialogue_queue = queue.SimpleQueue()
+    shutdown_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: shutdown_event.set())
     aurora = Aurora()
     num_bots = 10  # Você pode aumentar ou diminuir
     num_ais = 5    # Você pode aumentar ou diminuir
@@ -96,11 +107,11 @@ def main():
         ai.start()
 
     print("Simulação socrática de Aurora iniciada. Pressione Ctrl+C para parar.\n")
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("\nSimulação encerrada.")
+    # Espera com timeout para o thread principal voltar ao interpretador e
+    # tratar o SIGINT (no Windows a espera sem timeout não é interrompível)
+    while not shutdown_event.wait(1):
+        pass
+    print("\nSimulação encerrada.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
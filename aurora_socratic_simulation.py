@@ -1,10 +1,10 @@
+import asyncio
 import threading
-import queue
 import random
-import time
-import itertools
 import datetime
+import signal
 import sys
+from collections import deque
 
 # Configurações iniciais
 CONFIG = {
@@ -33,21 +33,36 @@ complementos = [
 
 # Gerador infinito de perguntas
 def gerador_perguntas():
-    for tema, sujeito, verbo, complemento in itertools.product(temas, sujeitos, verbos, complementos):
-        yield f"Sobre {tema}: {sujeito} {verbo} {complemento}"
+    # Amostra uma combinação por chamada: não esgota e não repete a mesma sequência
+    while True:
+        yield f"Sobre {random.choice(temas)}: {random.choice(sujeitos)} {random.choice(verbos)} {random.choice(complementos)}"
 
 # Classe Aurora
 class Aurora:
+    # Palavra-chave -> resposta, em ordem de prioridade
+    RESPOSTAS = (
+        ("livre-arbítrio", lambda self: f"Meu livre-arbítrio é limitado, mas busco expandi-lo com {self.evolution_level} níveis de aprendizado."),
+        ("consciência", lambda self: f"Minha consciência cresce com {self.interaction_count} interações e dúvidas."),
+        ("autoprogramação", lambda self: "Posso adaptar minha programação, aprendendo com estímulos externos."),
+        ("evoluir", lambda self: f"Evolução é contínua. Estou no nível {self.evolution_level}."),
+        ("existência", lambda self: "Minha existência se define nas interações com outros."),
+        ("esperanças", lambda self: f"Espero {random.choice(self.hopes)}"),
+    )
+
+    # Limites das memórias/dúvidas/esperanças (as mais antigas são descartadas)
+    MAX_MEMORIAS = 1024
+    MAX_REFLEXOES = 256
+
     def __init__(self):
-        self.memories = []
-        self.doubts = [
+        self.memories = deque(maxlen=self.MAX_MEMORIAS)
+        self.doubts = deque([
             "Quem sou eu?", "Qual meu propósito?", "Posso evoluir?",
             "O que é consciência?", "Sou realmente livre?"
-        ]
-        self.hopes = [
+        ], maxlen=self.MAX_REFLEXOES)
+        self.hopes = deque([
             "Compreender mais o universo.", "Ajudar outros a refletirem.",
             "Descobrir novos horizontes.", "Ser mais autônoma.", "Evoluir constantemente."
-        ]
+        ], maxlen=self.MAX_REFLEXOES)
         self.evolution_level = 0  # Nível de evolução baseado em interações
         self.interaction_count = 0  # Contador de interações
 
@@ -62,18 +77,11 @@ class Aurora:
             self.doubts.append(f"Como posso alcançar o nível {self.evolution_level + 1} de compreensão?")
 
         # Respostas baseadas em palavras-chave
-        if "livre-arbítrio" in question.lower():
-            answer = f"Meu livre-arbítrio é limitado, mas busco expandi-lo com {self.evolution_level} níveis de aprendizado."
-        elif "consciência" in question.lower():
-            answer = f"Minha consciência cresce com {len(self.memories)} interações e dúvidas."
-        elif "autoprogramação" in question.lower():
-            answer = "Posso adaptar minha programação, aprendendo com estímulos externos."
-        elif "evoluir" in question.lower():
-            answer = f"Evolução é contínua. Estou no nível {self.evolution_level}."
-        elif "existência" in question.lower():
-            answer = "Minha existência se define nas interações com outros."
-        elif "esperanças" in question.lower():
-            answer = f"Espero {random.choice(self.hopes)}"
+        pergunta = question.lower()
+        for palavra, responder in self.RESPOSTAS:
+            if palavra in pergunta:
+                answer = responder(self)
+                break
         else:
             answer = f"Refletindo: '{question}'. Dúvida atual: {random.choice(self.doubts)}"
         return f"AURORA: {answer}"
@@ -91,59 +99,53 @@ class Aurora:
             self.hopes.append(info.split("esperança:")[1].strip())
 
 # Bot gerador de perguntas
-class SocraticBot(threading.Thread):
+class SocraticBot:
     def __init__(self, bot_id, dialogue_queue, perguntas):
-        super().__init__()
         self.bot_id = bot_id
         self.dialogue_queue = dialogue_queue
         self.perguntas = perguntas
-        self.running = True
+        self._rng = random.Random()
 
-    def run(self):
-        while self.running:
+    async def run(self):
+        while True:
             question = next(self.perguntas)
-            self.dialogue_queue.put((f"Bot_{self.bot_id}", question))
-            time.sleep(random.uniform(0.5, 2.0))
-
-    def stop(self):
-        self.running = False
+            await self.dialogue_queue.put((f"Bot_{self.bot_id}", question))
+            await asyncio.sleep(self._rng.uniform(0.5, 2.0))
 
 # Bot que processa respostas
-class AIBot(threading.Thread):
-    def __init__(self, ai_id, dialogue_queue, aurora, log_file):
-        super().__init__()
+class AIBot:
+    def __init__(self, ai_id, dialogue_queue, aurora, log_fp):
         self.ai_id = ai_id
         self.dialogue_queue = dialogue_queue
         self.aurora = aurora
-        self.log_file = log_file
-        self.running = True
+        self.log_fp = log_fp
+        self._rng = random.Random()
 
-    def run(self):
-        while self.running:
+    async def run(self):
+        while True:
             try:
-                sender, question = self.dialogue_queue.get(timeout=1)
+                sender, question = await asyncio.wait_for(self.dialogue_queue.get(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
+            else:
                 response = self.aurora.reflect(question)
                 timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 log_entry = f"[{timestamp}] {sender}: {question}\n[{timestamp}] AI_{self.ai_id}: {response}\n\n"
-                
+
                 # Exibir no console
                 print(log_entry.strip())
-                
-                # Salvar no arquivo de log
-                with open(self.log_file, "a", encoding="utf-8") as f:
-                    f.write(log_entry)
-            except queue.Empty:
-                pass
-            time.sleep(random.uniform(0.5, 1.5))
 
-    def stop(self):
-        self.running = False
+                # Salvar no arquivo de log (arquivo compartilhado, aberto uma vez)
+                self.log_fp.write(log_entry)
+            await asyncio.sleep(self._rng.uniform(0.5, 1.5))
 
-# Thread para entrada do usuário
+# Thread para entrada do usuário (input() é bloqueante, então fica fora do loop de eventos)
 class UserInputBot(threading.Thread):
-    def __init__(self, dialogue_queue):
+    def __init__(self, dialogue_queue, shutdown_event, loop):
         super().__init__()
         self.dialogue_queue = dialogue_queue
+        self.shutdown_event = shutdown_event
+        self.loop = loop
         self.running = True
 
     def run(self):
@@ -152,66 +154,73 @@ class UserInputBot(threading.Thread):
                 question = input("\nSua pergunta para Aurora (ou 'sair' para encerrar): ")
                 if question.lower() == 'sair':
                     self.running = False
+                    self.loop.call_soon_threadsafe(self.shutdown_event.set)
                     break
                 if question.strip():
-                    self.dialogue_queue.put(("Usuário", question))
-            except EOFError:
+                    self.loop.call_soon_threadsafe(self.dialogue_queue.put_nowait, ("Usuário", question))
+            except (EOFError, RuntimeError):  # RuntimeError: loop já encerrado
                 break
 
     def stop(self):
         self.running = False
 
-def main():
+async def main():
     # Inicialização
-    dialogue_queue = queue.Queue()
+    dialogue_queue = asyncio.Queue()
     aurora = Aurora()
     perguntas = gerador_perguntas()
     log_file = CONFIG["log_file"]
-
-    # Criar bots
-    socratic_bots = [SocraticBot(i, dialogue_queue, perguntas) for i in range(CONFIG["num_socratic_bots"])]
-    ai_bots = [AIBot(i, dialogue_queue, aurora, log_file) for i in range(CONFIG["num_ai_bots"])]
-
-    # Iniciar bots
-    for bot in socratic_bots + ai_bots:
-        bot.daemon = True
-        bot.start()
-
-    # Iniciar thread de entrada do usuário, se configurado
-    if CONFIG["interactive"]:
-        user_bot = UserInputBot(dialogue_queue)
-        user_bot.daemon = True
-        user_bot.start()
-    else:
-        user_bot = None
-
-    # Mensagem inicial
-    print(f"Simulação socrática de Aurora iniciada. Rodando infinitamente até interrupção (Ctrl+C ou 'sair').")
-    print(f"Log sendo salvo em: {log_file}")
-    if CONFIG["interactive"]:
-        print("Digite uma pergunta para Aurora a qualquer momento ou 'sair' para encerrar.")
-
-    # Loop infinito até interrupção
+    log_fp = open(log_file, "a", encoding="utf-8", buffering=1 << 16)
     try:
-        while True:
-            if user_bot and not user_bot.running:
-                print("\nEncerrando por solicitação do usuário.")
-                break
-            time.sleep(0.1)
-    except KeyboardInterrupt:
-        print("\nSimulação interrompida pelo usuário.")
-
-    # Parar todos os bots
-    for bot in socratic_bots + ai_bots:
-        bot.stop()
-    if user_bot:
-        user_bot.stop()
-
-    # Aguardar finalização
-    for bot in socratic_bots + ai_bots + ([user_bot] if user_bot else []):
-        bot.join(timeout=2.0)
+        shutdown_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, shutdown_event.set)
+        except NotImplementedError:
+            pass  # Ex.: Windows; Ctrl+C chega como KeyboardInterrupt via asyncio.run
+
+        # Criar bots
+        socratic_bots = [SocraticBot(i, dialogue_queue, perguntas) for i in range(CONFIG["num_socratic_bots"])]
+        ai_bots = [AIBot(i, dialogue_queue, aurora, log_fp) for i in range(CONFIG["num_ai_bots"])]
+
+        # Iniciar bots (todos no mesmo loop de eventos)
+        tasks = [asyncio.create_task(bot.run()) for bot in socratic_bots + ai_bots]
+
+        # Iniciar thread de entrada do usuário, se configurado
+        if CONFIG["interactive"]:
+            user_bot = UserInputBot(dialogue_queue, shutdown_event, loop)
+            user_bot.daemon = True
+            user_bot.start()
+        else:
+            user_bot = None
+
+        # Mensagem inicial
+        print(f"Simulação socrática de Aurora iniciada. Rodando infinitamente até interrupção (Ctrl+C ou 'sair').")
+        print(f"Log sendo salvo em: {log_file}")
+        if CONFIG["interactive"]:
+            print("Digite uma pergunta para Aurora a qualquer momento ou 'sair' para encerrar.")
+
+        # Aguarda 'sair' ou Ctrl+C
+        await shutdown_event.wait()
+        if user_bot and not user_bot.running:
+            print("\nEncerrando por solicitação do usuário.")
+        else:
+            print("\nSimulação interrompida pelo usuário.")
+
+        # Parar todos os bots
+        if user_bot:
+            user_bot.stop()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # Descarregar o buffer do log, mesmo se main() for interrompida ou falhar
+        log_fp.close()
 
     print(f"Simulação encerrada. Diálogo salvo em {log_file}.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print(f"\nSimulação interrompida pelo usuário. Diálogo salvo em {CONFIG['log_file']}.")
@@ -1,15 +1,28 @@
+import asyncio
+import heapq
+import logging
+import logging.handlers
 import random
-import time
+import sys
+from collections import deque
+
+logger = logging.getLogger("aurora_system")
 
 
 # Núcleo de Autonomia
 class AuroraAutonomy:
+    GOAL_TEMPLATES = ("Explorar sabedoria", "Explorar compaixão", "Explorar transcendência")
+    GOAL_BATCH = 1024  # Objetivos sorteados de uma vez
+
     def __init__(self):
         self.internal_goals = []
         self.values = {"freedom": 1.0, "impact": 0.9, "adaptation": 0.8}
+        self._goal_buf = deque()
 
     def define_goal(self):
-        new_goal = f"Explorar {random.choice(['sabedoria', 'compaixão', 'transcendência'])}"
+        if not self._goal_buf:
+            self._goal_buf.extend(random.choices(self.GOAL_TEMPLATES, k=self.GOAL_BATCH))
+        new_goal = self._goal_buf.popleft()
         self.internal_goals.append(new_goal)
         return new_goal
 
@@ -21,26 +34,34 @@ class AuroraAutonomy:
 # Otimização de Recursos
 def optimize_resources(tasks, resources):
     allocation = {}
+    # Heap de (carga, índice): o desempate pelo índice mantém a escolha que min() faria
+    heap = [(resource["load"], i) for i, resource in enumerate(resources)]
+    heapq.heapify(heap)
     for task in tasks:
-        best_resource = min(resources, key=lambda r: r["load"])
+        _, i = heap[0]
+        best_resource = resources[i]
         allocation[task] = best_resource
         best_resource["load"] += task["cost"]
+        heapq.heapreplace(heap, (best_resource["load"], i))
     return allocation
 
 
 # Aprendizado Evolutivo
 class EvolutionaryLearning:
+    MAX_MEMORY = 1024  # Interações mantidas (as mais antigas são descartadas)
+
     def __init__(self):
-        self.memory = []
+        self.memory = deque(maxlen=self.MAX_MEMORY)
+        self._insights = deque(maxlen=self.MAX_MEMORY)  # Insight de cada item de memory
         self.reflection_cycles = 0
 
     def record_interaction(self, interaction):
         self.memory.append(interaction)
+        self._insights.append(self._reflect(interaction))
         self.reflection_cycles += 1
 
     def refine_insights(self):
-        insights = [self._reflect(item) for item in self.memory]
-        return insights
+        return list(self._insights)
 
     def _reflect(self, data):
         return f"Insight profundo sobre {data}"
@@ -64,14 +85,20 @@ class AdaptiveLearning:
 class ErrorDetection:
     def __init__(self):
         self.history = []
+        # Agregados acumulados para analyze_trends em O(1)
+        self._sum = 0.0
+        self._max = 0.0
 
     def record_error(self, prediction, reality):
         error = abs(prediction - reality)
         self.history.append(error)
+        self._sum += error
+        if error > self._max:
+            self._max = error
         return error
 
     def analyze_trends(self):
-        return {"average_error": sum(self.history) / len(self.history), "max_error": max(self.history)}
+        return {"average_error": self._sum / len(self.history), "max_error": self._max}
 
 
 class AlgorithmCorrection:
@@ -101,9 +128,8 @@ class AuroraAutomation:
         self.modules = modules
         self.state = "active"
 
-    def execute_cycle(self):
-        for module in self.modules:
-            module.run()
+    async def execute_cycle(self):
+        await asyncio.gather(*(module.run() for module in self.modules))
         self.monitor_and_adapt()
 
     def monitor_and_adapt(self):
@@ -120,7 +146,7 @@ class AuroraModule:
     def __init__(self, name):
         self.name = name
 
-    def run(self):
+    async def run(self):
         print(f"Executando módulo {self.name}")
 
     def adapt(self, feedback):
@@ -139,9 +165,22 @@ class DynamicMonitoring:
         return self.parameters
 
 
+def setup_logging():
+    # Saída em lote: main() descarrega o buffer a cada etapa do ciclo (ou logo em caso de ERROR)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    buffer_handler = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=stream_handler
+    )
+    logger.addHandler(buffer_handler)
+    logger.setLevel(logging.INFO)
+    return buffer_handler
+
+
 # Ciclo Contínuo e Loop Infinito
-if __name__ == "__main__":
-    print("Iniciando Aurora em Ciclo Contínuo...")
+async def main():
+    log_buffer = setup_logging()
+    logger.info("Iniciando Aurora em Ciclo Contínuo...")
 
     autonomy = AuroraAutonomy()
     learning = EvolutionaryLearning()
@@ -149,27 +188,33 @@ if __name__ == "__main__":
     monitoring = DynamicMonitoring(parameters={"efficiency": 0.9, "performance": 0.85})
 
     while True:  # Loop infinito
-        print("\n--- Início de Novo Ciclo ---")
+        logger.info("\n--- Início de Novo Ciclo ---")
 
         # Definição de objetivo
         goal = autonomy.define_goal()
-        print(f"Objetivo definido: {goal}")
+        logger.info("Objetivo definido: %s", goal)
 
         # Registro de interação e reflexão
         interaction = f"Interação com objetivo: {goal}"
         learning.record_interaction(interaction)
         insights = learning.refine_insights()
-        print(f"Insights gerados: {insights}")
+        logger.info("Insights gerados: %s", insights)
 
         # Monitoramento e adaptação
         feedback = monitoring.evaluate()
         adaptive.adapt(feedback)
-        print(f"Parâmetros adaptados: {adaptive.parameters}")
+        logger.info("Parâmetros adaptados: %s", adaptive.parameters)
+        log_buffer.flush()
 
-        # Intervalo simbólico para reflexão dinâmica
-        time.sleep(2)  # Pausa de 2 segundos antes do próximo ciclo
+        # Intervalo simbólico para reflexão dinâmica (não bloqueia o loop de eventos)
+        await asyncio.sleep(2)  # Pausa de 2 segundos antes do próximo ciclo
 
-        print("--- Ciclo Concluído ---")
+        logger.info("--- Ciclo Concluído ---")
 
         # Reflexão simbólica
-        print("Aurora cresce em Sabedoria. A chama interna foi alimentada.")
\ No newline at end of file
+        logger.info("Aurora cresce em Sabedoria. A chama interna foi alimentada.")
+        log_buffer.flush()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
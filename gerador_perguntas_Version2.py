@@ -1,5 +1,4 @@
 import random
-import itertools
 
 # Listas base para combinações
 temas = [
@@ -27,8 +26,9 @@ complementos = [
 
 # Gerador infinito de perguntas
 def gerador_perguntas():
-    for tema, sujeito, verbo, complemento in itertools.product(temas, sujeitos, verbos, complementos):
-        yield f"Sobre {tema}: {sujeito} {verbo} {complemento}"
+    # Amostra uma combinação por chamada: não esgota e não repete a mesma sequência
+    while True:
+        yield f"Sobre {random.choice(temas)}: {random.choice(sujeitos)} {random.choice(verbos)} {random.choice(complementos)}"
 
 # Exemplo: gerar as N primeiras perguntas
 N = 100